@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 
 from numpy.lib.histograms import histogram, histogramdd, histogram_bin_edges
@@ -8,18 +10,18 @@
     )
 import pytest
 
+# Shared random inputs.  ``histogram`` and ``histogramdd`` never write to
+# their arguments, so these are safe to reuse across tests.
+_V100 = np.random.RandomState(0).rand(100)
+_V100x2 = np.random.RandomState(0).rand(100, 2)
+_W100 = np.full(100, 5.0)
 
-class TestHistogram:
-
-    def setup(self):
-        pass
 
-    def teardown(self):
-        pass
+class TestHistogram:
 
     def test_simple(self):
         n = 100
-        v = np.random.rand(n)
+        v = _V100
         (a, b) = histogram(v)
         # check if the sum of the bins equals the number of samples
         assert_equal(np.sum(a, axis=0), n)
@@ -43,8 +45,7 @@ def test_normed(self):
         with sup:
             rec = sup.record(np.VisibleDeprecationWarning, '.*normed.*')
             # Check that the integral of the density equals 1.
-            n = 100
-            v = np.random.rand(n)
+            v = _V100
             a, b = histogram(v, normed=True)
             area = np.sum(a * np.diff(b))
             assert_almost_equal(area, 1)
@@ -64,8 +65,7 @@ def test_normed(self):
 
     def test_density(self):
         # Check that the integral of the density equals 1.
-        n = 100
-        v = np.random.rand(n)
+        v = _V100
         a, b = histogram(v, density=True)
         area = np.sum(a * np.diff(b))
         assert_almost_equal(area, 1)
@@ -108,12 +108,14 @@ def test_outliers(self):
 
         # Normalization
         h, b = histogram(a, range=[1, 9], density=True)
-        assert_almost_equal((h * np.diff(b)).sum(), 1, decimal=15)
+        # the bins are of equal width, so the area is just a scaled sum
+        width = (b[-1] - b[0]) / len(h)
+        assert_almost_equal(h.sum() * width, 1, decimal=15)
 
         # Weights
         w = np.arange(10) + .5
         h, b = histogram(a, range=[1, 9], weights=w, density=True)
-        assert_equal((h * np.diff(b)).sum(), 1)
+        assert_equal(h.sum() * width, 1)
 
         h, b = histogram(a, bins=8, range=[1, 9], weights=w)
         assert_equal(h, w[1:-1])
@@ -165,8 +167,8 @@ def test_bool_conversion(self):
             assert_array_equal(edges, int_edges)
 
     def test_weights(self):
-        v = np.random.rand(100)
-        w = np.ones(100) * 5
+        v = _V100
+        w = _W100
         a, b = histogram(v)
         na, nb = histogram(v, density=True)
         wa, wb = histogram(v, weights=w)
@@ -230,8 +232,13 @@ def test_no_side_effects(self):
         np.histogram(values, range=[-10, 10], bins=100)
         assert_array_almost_equal(values, [1.3, 2.5, 2.3])
 
-    def test_empty(self):
-        a, b = histogram([], bins=([0, 1]))
+    @pytest.mark.parametrize("bins", [[0, 1], 'fd', 'scott', 'rice',
+                                      'sturges', 'doane', 'sqrt', 'auto',
+                                      'stone'])
+    def test_empty(self, bins):
+        # check it can deal with empty data, with explicit bins and with
+        # each of the bin estimators
+        a, b = histogram([], bins=bins)
         assert_array_equal(a, np.array([0]))
         assert_array_equal(b, np.array([0, 1]))
 
@@ -254,10 +261,16 @@ def test_invalid_range(self):
         with assert_raises_regex(ValueError, "max must be larger than"):
             np.histogram(vals, range=[0.1, 0.01])
 
-    def test_bin_edge_cases(self):
+    @pytest.mark.parametrize("bins", [
+        # samples fall on bin edges, index computed one too low / too high
+        170, 442,
+        # the original report, where every sample is misplaced
+        pytest.param(8296, marks=pytest.mark.slow),
+    ])
+    def test_bin_edge_cases(self, bins):
         # Ensure that floating-point computations correctly place edge cases.
         arr = np.array([337, 404, 739, 806, 1007, 1811, 2012])
-        hist, edges = np.histogram(arr, bins=8296, range=(2, 2280))
+        hist, edges = np.histogram(arr, bins=bins, range=(2, 2280))
         mask = hist > 0
         left_edges = edges[:-1][mask]
         right_edges = edges[1:][mask]
@@ -428,16 +441,18 @@ class TestHistogramOptimBinNums:
     bins
     """
 
-    def test_empty(self):
-        estimator_list = ['fd', 'scott', 'rice', 'sturges',
-                          'doane', 'sqrt', 'auto', 'stone']
-        # check it can deal with empty data
-        for estimator in estimator_list:
-            a, b = histogram([], bins=estimator)
-            assert_array_equal(a, np.array([0]))
-            assert_array_equal(b, np.array([0, 1]))
-
-    def test_simple(self):
+    @pytest.fixture(scope='class', params=[50, 500, 5000])
+    def two_peak_data(self, request):
+        # Create some sort of non uniform data to test with
+        # (2 peak uniform mixture)
+        testlen = request.param
+        x1 = np.linspace(-10, -1, testlen // 5 * 2)
+        x2 = np.linspace(1, 10, testlen // 5 * 3)
+        return testlen, np.concatenate((x1, x2))
+
+    @pytest.mark.parametrize("estimator", ['fd', 'scott', 'rice', 'sturges',
+                                           'doane', 'sqrt', 'auto', 'stone'])
+    def test_simple(self, two_peak_data, estimator):
         """
         Straightforward testing with a mixture of linspace data (for
         consistency). All test values have been precomputed and the values
@@ -452,16 +467,11 @@ def test_simple(self):
                       5000: {'fd': 17, 'scott': 17, 'rice': 35, 'sturges': 14,
                              'doane': 17, 'sqrt': 71, 'auto': 17, 'stone': 20}}
 
-        for testlen, expectedResults in basic_test.items():
-            # Create some sort of non uniform data to test with
-            # (2 peak uniform mixture)
-            x1 = np.linspace(-10, -1, testlen // 5 * 2)
-            x2 = np.linspace(1, 10, testlen // 5 * 3)
-            x = np.concatenate((x1, x2))
-            for estimator, numbins in expectedResults.items():
-                a, b = np.histogram(x, estimator)
-                assert_equal(len(a), numbins, err_msg="For the {0} estimator "
-                             "with datasize of {1}".format(estimator, testlen))
+        testlen, x = two_peak_data
+        a, b = np.histogram(x, estimator)
+        assert_equal(len(a), basic_test[testlen][estimator],
+                     err_msg="For the {0} estimator "
+                     "with datasize of {1}".format(estimator, testlen))
 
     def test_small(self):
         """
@@ -559,7 +569,19 @@ def nbins_ratio(seed, size):
         avg = abs(np.mean(ll, axis=0) - 0.5)
         assert_almost_equal(avg, [0.15, 0.09, 0.08, 0.03], decimal=2)
 
-    def test_simple_range(self):
+    @pytest.fixture(scope='class', params=[50, 500, 5000])
+    def three_peak_data(self, request):
+        # create some sort of non uniform data to test with
+        # (3 peak uniform mixture)
+        testlen = request.param
+        x1 = np.linspace(-10, -1, testlen // 5 * 2)
+        x2 = np.linspace(1, 10, testlen // 5 * 3)
+        x3 = np.linspace(-100, -50, testlen)
+        return testlen, np.hstack((x1, x2, x3))
+
+    @pytest.mark.parametrize("estimator", ['fd', 'scott', 'rice', 'sturges',
+                                           'auto', 'stone'])
+    def test_simple_range(self, three_peak_data, estimator):
         """
         Straightforward testing with a mixture of linspace data (for
         consistency). Adding in a 3rd mixture that will then be
@@ -577,18 +599,11 @@ def test_simple_range(self):
                              'sturges': 27, 'auto': 33, 'stone': 80}
                      }
 
-        for testlen, expectedResults in basic_test.items():
-            # create some sort of non uniform data to test with
-            # (3 peak uniform mixture)
-            x1 = np.linspace(-10, -1, testlen // 5 * 2)
-            x2 = np.linspace(1, 10, testlen // 5 * 3)
-            x3 = np.linspace(-100, -50, testlen)
-            x = np.hstack((x1, x2, x3))
-            for estimator, numbins in expectedResults.items():
-                a, b = np.histogram(x, estimator, range = (-20, 20))
-                msg = "For the {0} estimator".format(estimator)
-                msg += " with datasize of {0}".format(testlen)
-                assert_equal(len(a), numbins, err_msg=msg)
+        testlen, x = three_peak_data
+        a, b = np.histogram(x, estimator, range = (-20, 20))
+        msg = "For the {0} estimator".format(estimator)
+        msg += " with datasize of {0}".format(testlen)
+        assert_equal(len(a), basic_test[testlen][estimator], err_msg=msg)
 
     @pytest.mark.parametrize("bins", ['auto', 'fd', 'doane', 'scott',
                                       'stone', 'rice', 'sturges'])
@@ -645,35 +660,27 @@ def test_simple(self):
         assert_array_equal(H, answer)
 
         Z = np.zeros((5, 5, 5))
-        Z[list(range(5)), list(range(5)), list(range(5))] = 1.
+        i = np.arange(5)
+        Z[i, i, i] = 1.
         H, edges = histogramdd([np.arange(5), np.arange(5), np.arange(5)], 5)
         assert_array_equal(H, Z)
 
-    def test_shape_3d(self):
-        # All possible permutations for bins of different lengths in 3D.
-        bins = ((5, 4, 6), (6, 4, 5), (5, 6, 4), (4, 6, 5), (6, 5, 4),
-                (4, 5, 6))
+    # All possible permutations for bins of different lengths in 3D.
+    @pytest.mark.parametrize("b", list(itertools.permutations((4, 5, 6))))
+    def test_shape_3d(self, b):
         r = np.random.rand(10, 3)
-        for b in bins:
-            H, edges = histogramdd(r, b)
-            assert_(H.shape == b)
-
-    def test_shape_4d(self):
-        # All possible permutations for bins of different lengths in 4D.
-        bins = ((7, 4, 5, 6), (4, 5, 7, 6), (5, 6, 4, 7), (7, 6, 5, 4),
-                (5, 7, 6, 4), (4, 6, 7, 5), (6, 5, 7, 4), (7, 5, 4, 6),
-                (7, 4, 6, 5), (6, 4, 7, 5), (6, 7, 5, 4), (4, 6, 5, 7),
-                (4, 7, 5, 6), (5, 4, 6, 7), (5, 7, 4, 6), (6, 7, 4, 5),
-                (6, 5, 4, 7), (4, 7, 6, 5), (4, 5, 6, 7), (7, 6, 4, 5),
-                (5, 4, 7, 6), (5, 6, 7, 4), (6, 4, 5, 7), (7, 5, 6, 4))
+        H, edges = histogramdd(r, b)
+        assert_(H.shape == b)
 
+    # All possible permutations for bins of different lengths in 4D.
+    @pytest.mark.parametrize("b", list(itertools.permutations((4, 5, 6, 7))))
+    def test_shape_4d(self, b):
         r = np.random.rand(10, 4)
-        for b in bins:
-            H, edges = histogramdd(r, b)
-            assert_(H.shape == b)
+        H, edges = histogramdd(r, b)
+        assert_(H.shape == b)
 
     def test_weights(self):
-        v = np.random.rand(100, 2)
+        v = _V100x2
         hist, edges = histogramdd(v)
         n_hist, edges = histogramdd(v, density=True)
         w_hist, edges = histogramdd(v, weights=np.ones(100))